@@ -0,0 +1,38 @@
+#!/usr/bin/env bash
+# Start a long-lived Chrome that webclicker_auto_fixed.py can attach to.
+#
+#   ./launch_chrome.sh &
+#   WC_DEBUGGER_ADDR=127.0.0.1:9222 python webclicker_auto_fixed.py --url "..."
+#
+# The profile in $WC_PROFILE_DIR persists between runs, so cookies and logins do too.
+set -euo pipefail
+
+PORT="${WC_DEBUG_PORT:-9222}"
+PROFILE_DIR="${WC_PROFILE_DIR:-/tmp/wc}"
+
+if [ -n "${CHROME_BIN:-}" ]; then
+    CHROME="$CHROME_BIN"
+elif [ "$(uname)" = "Darwin" ]; then
+    CHROME="/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+else
+    CHROME="$(command -v google-chrome || command -v chromium || command -v chromium-browser)"
+fi
+
+# Chrome refuses to start sandboxed as root (containers/CI); only drop the
+# sandbox there or when explicitly asked to, matching webclicker_auto_fixed.py
+EXTRA_FLAGS=()
+if [ "$(id -u)" -eq 0 ] || [ "${CHROME_NO_SANDBOX:-}" = "1" ]; then
+    EXTRA_FLAGS+=(--no-sandbox)
+fi
+
+exec "$CHROME" \
+    --remote-debugging-port="$PORT" \
+    --user-data-dir="$PROFILE_DIR" \
+    --disable-extensions \
+    --disable-notifications \
+    --disable-background-networking \
+    --disable-sync \
+    --mute-audio \
+    --blink-settings=imagesEnabled=false \
+    ${EXTRA_FLAGS[@]+"${EXTRA_FLAGS[@]}"} \
+    "$@"
@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import functools
+import json
 import random
 import time
 import os
@@ -7,10 +9,16 @@ from typing import Optional, List
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    JavascriptException,
+    NoSuchFrameException,
+    UnknownMethodException
+)
 import logging
 import subprocess
 
@@ -22,7 +30,74 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Common Chrome install locations on macOS
+MAC_CHROME_PATHS = (
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    "/Applications/Chrome.app/Contents/MacOS/Chrome"
+)
+
+# Buttons labelled with a single answer letter A-E, matched by the XPath engine
+# so no per-button text has to be read back into Python
+ANSWER_XPATH = (
+    "//button[translate(normalize-space(.),'abcde','ABCDE')=normalize-space(.)"
+    " and string-length(normalize-space(.))=1"
+    " and contains('ABCDE',normalize-space(.))]"
+)
+
+# Errors a poll check can hit while the page reloads or swaps frames; anything
+# else (closed window, dead session) ends the run
+TRANSIENT_CHECK_ERRORS = (
+    JavascriptException,
+    StaleElementReferenceException,
+    NoSuchElementException,
+    NoSuchFrameException,
+    TimeoutException
+)
+
+# Seconds the in-page MutationObserver may block before handing control back
+POLL_WATCH_TIMEOUT = 300
+# The watcher gives up by itself this long before the script timeout, so it can
+# disconnect its observer and be re-armed cleanly
+POLL_WATCH_MARGIN = 5
+
+# Resources the automator never needs; blocked via CDP to cut page-load bandwidth
+BLOCKED_URL_PATTERNS = [
+    "*.woff*", "*.png", "*.jpg", "*.gif", "*.svg", "*googletag*", "*analytics*"
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_chrome_binary() -> Optional[str]:
+    """Return the first Chrome binary found for this OS, or None.
+    
+    Cached so repeated automator instantiations don't re-stat the filesystem.
+    """
+    if platform.system() == "Darwin":  # macOS
+        for path in MAC_CHROME_PATHS:
+            if os.path.exists(path):
+                return path
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _detect_chrome_version(chrome_path: str) -> str:
+    """Return the ``--version`` output of the given Chrome binary (cached)."""
+    try:
+        result = subprocess.run(
+            [chrome_path, "--version"], capture_output=True, text=True, timeout=2
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return f"unknown ({e})"
+    return result.stdout.strip()
+
+
 class WebclickerAutomator:
+    # Page markers, built once and passed into the in-page scripts as arguments
+    CHOICE_XPATH = "//button[@data-choice] | " + ANSWER_XPATH
+    NO_POLL_TEXT = "No current poll"
+    # Fastest re-check interval used right after a poll starts or ends (seconds)
+    MIN_BACKOFF = 0.2
+    
     def __init__(
         self,
         url: str,
@@ -36,7 +111,7 @@ class WebclickerAutomator:
         
         Args:
             url: The URL of the webclicker site
-            check_interval: How often to check for new polls (seconds)
+            check_interval: Longest gap between checks for new polls while idle (seconds)
             headless: Whether to run the browser in headless mode
             username: Optional username for login
             password: Optional password for login
@@ -45,59 +120,168 @@ class WebclickerAutomator:
         self.check_interval = check_interval
         self.username = username
         self.password = password
+        # Per-instance RNG so answer picks don't depend on global random state
+        self._rng = random.Random(time.time_ns())
         
         # Set up Chrome options
         chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-popup-blocking")
-        
-        # Try to find Chrome browser path based on OS
-        if platform.system() == "Darwin":  # macOS
-            # Check for common Chrome locations on macOS
-            chrome_paths = [
-                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                "/Applications/Chrome.app/Contents/MacOS/Chrome"
-            ]
+        debugger_address = os.environ.get("WC_DEBUGGER_ADDR")
+        if debugger_address:
+            # Attach to an already-running Chrome (see launch_chrome.sh) instead
+            # of launching a fresh one; its flags were fixed when it started
+            chrome_options.add_experimental_option("debuggerAddress", debugger_address)
+            logger.info(f"Attaching to running Chrome at: {debugger_address}")
+        else:
+            if headless:
+                chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--window-size=1920,1080")
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-notifications")
+            chrome_options.add_argument("--disable-popup-blocking")
+            # Trim startup and render work Chrome does on our behalf
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_argument("--disable-sync")
+            chrome_options.add_argument("--metrics-recording-only")
+            chrome_options.add_argument("--mute-audio")
+            # Chrome refuses to start sandboxed as root (containers/CI); only
+            # drop the sandbox there or when explicitly asked to
+            if getattr(os, "geteuid", lambda: -1)() == 0 or os.environ.get("CHROME_NO_SANDBOX") == "1":
+                chrome_options.add_argument("--no-sandbox")
+            # Nothing is rendered for a human, so skip images and notification prompts
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            })
             
-            for path in chrome_paths:
-                if os.path.exists(path):
-                    chrome_options.binary_location = path
-                    logger.info(f"Using Chrome binary at: {path}")
-                    break
+            # Try to find Chrome browser path based on OS
+            chrome_binary = _detect_chrome_binary()
+            if chrome_binary:
+                chrome_options.binary_location = chrome_binary
+                logger.info(f"Using Chrome binary at: {chrome_binary}")
+        
+        # Return from driver.get() at DOMContentLoaded instead of waiting for
+        # every subresource; the poll wait gates on the widget itself
+        chrome_options.page_load_strategy = "eager"
         
         # Initialize the Chrome driver
         try:
-            # Try the simple approach first
-            self.driver = webdriver.Chrome(options=chrome_options)
+            # Try the simple approach first; keep-alive reuses one HTTP
+            # connection to chromedriver for every command
+            self.driver = webdriver.Chrome(options=chrome_options, keep_alive=True)
         except Exception as e:
+            if debugger_address:
+                # A downloaded chromedriver can't help if nothing is listening
+                raise Exception(
+                    f"No Chrome listening at WC_DEBUGGER_ADDR={debugger_address}. "
+                    "Start it with launch_chrome.sh or unset WC_DEBUGGER_ADDR."
+                ) from e
             logger.warning(f"Simple Chrome initialization failed: {e}")
-            logger.info("Trying alternative approach with browser detection...")
+            logger.info("Trying alternative approach with webdriver-manager...")
+            
+            # Log the Chrome version to help diagnose driver mismatches
+            if platform.system() == "Darwin":  # macOS
+                chrome_path = chrome_options.binary_location or MAC_CHROME_PATHS[0]
+                version_output = _detect_chrome_version(chrome_path)
+                logger.info(f"Chrome version info: {version_output}")
             
-            # Get Chrome version to use matching driver
             try:
-                if platform.system() == "Darwin":  # macOS
-                    # On macOS, try to get Chrome version
-                    chrome_path = chrome_options.binary_location or "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-                    cmd = f"'{chrome_path}' --version"
-                    process = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    stdout, stderr = process.communicate()
-                    version_output = stdout.decode('utf-8').strip()
-                    logger.info(f"Chrome version info: {version_output}")
-                
-                # Last resort: use Chrome directly with default service
-                self.driver = webdriver.Chrome(options=chrome_options)
+                # Fall back to a chromedriver downloaded to match the installed Chrome
+                service = Service(ChromeDriverManager().install())
+                self.driver = webdriver.Chrome(service=service, options=chrome_options, keep_alive=True)
                 
             except Exception as second_error:
                 logger.error(f"Failed to initialize Chrome driver: {second_error}")
                 raise Exception("Could not initialize Chrome driver. Make sure Chrome is installed.") from second_error
         
-        self.wait = WebDriverWait(self.driver, 10)
+        # Block fonts, images and trackers at the network layer
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Could not set blocked URLs: {e}")
+        
+        # Short explicit wait for one-off element lookups; the main loop blocks
+        # in _watch_for_poll()/_poll_until() instead, so a missing element
+        # should fail fast rather than stall
+        self.wait = WebDriverWait(
+            self.driver,
+            timeout=3,
+            poll_frequency=0.25,
+            ignored_exceptions=(StaleElementReferenceException,)
+        )
+        
+        # Upper bound on how long the in-page poll watcher may block
+        self.driver.set_script_timeout(POLL_WATCH_TIMEOUT)
         
+        # Current re-check interval; grows toward check_interval while nothing changes
+        self._backoff = self.MIN_BACKOFF
+        
+        # (elements, choices) from the last scan, reused while still attached
+        self._choice_cache = None
+        
+        # Cleared the first time the driver turns out not to support CDP
+        self._cdp_available = True
+        
+    _login_form_js = """
+        return {
+            inputs: Array.from(document.querySelectorAll('input')).map((e, i) =>
+                ({i: i, type: e.type, placeholder: e.placeholder || ''})),
+            buttons: Array.from(document.querySelectorAll('button')).map((e, i) =>
+                ({i: i, text: e.textContent.trim()}))
+        };
+    """
+    # Set values the way typing would, then submit. The value goes through the
+    # native HTMLInputElement setter so frameworks that track the value
+    # (React) see a change when the input/change events fire.
+    _fill_login_js = """
+        const inputs = document.querySelectorAll('input');
+        const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+        const fill = (el, value) => {
+            el.focus();
+            setValue.call(el, value);
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        };
+        fill(inputs[arguments[0]], arguments[1]);
+        fill(inputs[arguments[2]], arguments[3]);
+        document.querySelectorAll('button')[arguments[4]].click();
+    """
+    
+    def _evaluate(self, script: str, *args):
+        """Run a value-only script as one CDP Runtime.evaluate call.
+        
+        Takes the same script bodies as execute_script (``return`` and
+        ``arguments`` work), but skips WebDriver's script wrapping and
+        element serialization. Only use it for scripts that return plain
+        values; DOM nodes do not survive ``returnByValue``.
+        
+        Falls back to execute_script only when the driver has no CDP support.
+        Any other CDP error is raised as-is: the script may already have run
+        (e.g. the page navigated after a click), so it must not be retried.
+        """
+        if self._cdp_available:
+            expression = f"(function() {{{script}}}).apply(null, {json.dumps(args)})"
+            try:
+                response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                    "expression": expression,
+                    "returnByValue": True,
+                    "awaitPromise": False
+                })
+            except (AttributeError, UnknownMethodException) as e:
+                logger.info(f"Runtime.evaluate unavailable, using execute_script: {e}")
+                self._cdp_available = False
+            else:
+                if "exceptionDetails" in response:
+                    details = response["exceptionDetails"]
+                    description = details.get("exception", {}).get("description")
+                    raise JavascriptException(description or details.get("text", "Script error"))
+                return response["result"].get("value")
+        
+        return self.driver.execute_script(script, *args)
+    
     def login(self) -> bool:
         """Perform login if credentials are provided."""
         if not (self.username and self.password):
@@ -108,34 +292,37 @@ class WebclickerAutomator:
             # This is a placeholder as the login form details weren't visible
             logger.info("Attempting to log in")
             
-            # Look for login fields and buttons
-            login_elements = self.driver.find_elements(By.TAG_NAME, "input")
-            login_button = None
+            # Describe every input and button in one round-trip instead of
+            # reading attributes element by element
+            form = self._evaluate(self._login_form_js)
             
-            username_field = None
-            password_field = None
+            username_idx = None
+            password_idx = None
+            login_button_idx = None
             
-            for element in login_elements:
-                input_type = element.get_attribute("type")
-                placeholder = element.get_attribute("placeholder") or ""
+            for spec in form["inputs"]:
+                input_type = spec["type"]
+                placeholder = spec["placeholder"].lower()
                 
-                if input_type == "text" or "user" in placeholder.lower() or "email" in placeholder.lower():
-                    username_field = element
-                elif input_type == "password" or "password" in placeholder.lower():
-                    password_field = element
+                if input_type == "text" or "user" in placeholder or "email" in placeholder:
+                    username_idx = spec["i"]
+                elif input_type == "password" or "password" in placeholder:
+                    password_idx = spec["i"]
             
             # Look for button that might be the login button
-            buttons = self.driver.find_elements(By.TAG_NAME, "button")
-            for button in buttons:
-                button_text = button.text.lower()
+            for spec in form["buttons"]:
+                button_text = spec["text"].lower()
                 if "login" in button_text or "sign in" in button_text or "submit" in button_text:
-                    login_button = button
+                    login_button_idx = spec["i"]
             
             # Fill the form if fields were found
-            if username_field and password_field and login_button:
-                username_field.send_keys(self.username)
-                password_field.send_keys(self.password)
-                login_button.click()
+            if username_idx is not None and password_idx is not None and login_button_idx is not None:
+                self.driver.execute_script(
+                    self._fill_login_js,
+                    username_idx, self.username,
+                    password_idx, self.password,
+                    login_button_idx
+                )
                 logger.info("Login successful")
                 return True
             else:
@@ -146,70 +333,219 @@ class WebclickerAutomator:
             logger.error(f"Login failed: {e}")
             return False
 
+    # Single in-page scan for poll state and answer choices. The element
+    # references ride along in the same response so the chosen answer can be
+    # clicked directly and later ticks can validate them instead of re-scanning.
+    _scan_poll_js = """
+        const noPoll = document.body.innerText.includes(arguments[1]);
+        const snapshot = document.evaluate(
+            arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const choices = [];
+        const elements = [];
+        for (let idx = 0; idx < snapshot.snapshotLength; idx++) {
+            const el = snapshot.snapshotItem(idx);
+            choices.push({idx: idx, id: el.getAttribute('data-choice') || el.textContent.trim()});
+            elements.push(el);
+        }
+        return {active: !noPoll && choices.length > 0, choices: choices, elements: elements};
+    """
+    _poll_active_js = """
+        return !document.body.innerText.includes(arguments[1])
+            && document.evaluate(arguments[0], document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength > 0;
+    """
+    _choices_alive_js = """
+        return !document.body.innerText.includes(arguments[1])
+            && arguments[0].every(e => e && document.body.contains(e));
+    """
+    _click_choice_js = "arguments[0].click();"
+    # Scan, pick and click in a single execution. The pick is driven by a
+    # random fraction from Python so the choice stays reproducible via _rng.
+    _pick_and_click_js = """
+        if (document.body.innerText.includes(arguments[1])) return {clicked: null};
+        const snapshot = document.evaluate(
+            arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        if (!snapshot.snapshotLength) return {clicked: null};
+        const pick = snapshot.snapshotItem(Math.floor(arguments[2] * snapshot.snapshotLength));
+        pick.click();
+        return {clicked: pick.getAttribute('data-choice') || pick.textContent.trim()};
+    """
+    # Async script that resolves as soon as a DOM mutation brings the page to
+    # the requested poll state, so the browser pushes the change to us instead
+    # of being polled. Mutation bursts are coalesced into one check.
+    _watch_poll_js = """
+        const done = arguments[arguments.length - 1];
+        const wantActive = arguments[0];
+        const xpath = arguments[1];
+        const noPollText = arguments[2];
+        const giveUpAfterMs = arguments[3];
+        const isActive = () => !document.body.innerText.includes(noPollText)
+            && document.evaluate(xpath, document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength > 0;
+        if (isActive() === wantActive) { done(true); return; }
+        let pending = false;
+        let giveUp = null;
+        const observer = new MutationObserver(() => {
+            if (pending) return;
+            pending = true;
+            setTimeout(() => {
+                pending = false;
+                if (isActive() === wantActive) {
+                    observer.disconnect();
+                    clearTimeout(giveUp);
+                    done(true);
+                }
+            }, 10);
+        });
+        // Polls may also be shown/hidden by toggling class, style or hidden
+        observer.observe(document.body, {
+            childList: true, subtree: true, characterData: true,
+            attributes: true, attributeFilter: ['class', 'style', 'hidden']
+        });
+        giveUp = setTimeout(() => { observer.disconnect(); done(false); }, giveUpAfterMs);
+    """
+    
+    def scan_poll(self) -> dict:
+        """Read the poll state and answer choices in one round-trip.
+        
+        Returns:
+            Dict with "active" (bool), "choices" (list of {idx, id}) and
+            "elements" (the matching WebElements)
+        """
+        try:
+            return self.driver.execute_script(self._scan_poll_js, self.CHOICE_XPATH, self.NO_POLL_TEXT)
+        except Exception as e:
+            logger.error(f"Error scanning for active poll: {e}")
+            return {"active": False, "choices": [], "elements": []}
+    
     def is_poll_active(self) -> bool:
         """Check if there's an active poll."""
+        # When no poll is active, there's red text saying "No current poll".
+        # Only the flag is needed, so a value-only script is enough.
         try:
-            # Based on the screenshot when no poll is active, there's red text saying "No current poll"
-            # When a poll is active, this text should be absent or replaced with something else
-            no_poll_elements = self.driver.find_elements(
-                By.XPATH, 
-                "//*[contains(text(), 'No current poll')]"
-            )
-            
-            if no_poll_elements:
-                return False
-            
-            # Also check for answer buttons (A, B, C, D, E)
-            answer_buttons = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                "button[class*='answer'], .answer-option, button[data-choice]"
-            )
-            
-            # Look for buttons with letters A-E
-            letter_buttons = []
-            for button in self.driver.find_elements(By.TAG_NAME, "button"):
-                if button.text.strip() in ["A", "B"]:
-                    letter_buttons.append(button)
-            
-            return len(answer_buttons) > 0 or len(letter_buttons) > 0
-            
+            return self._evaluate(self._poll_active_js, self.CHOICE_XPATH, self.NO_POLL_TEXT)
         except Exception as e:
             logger.error(f"Error checking for active poll: {e}")
             return False
     
-    def get_answer_choices(self) -> List[tuple]:
-        """Get the available answer choices for the current poll.
+    def _poll_visible(self, driver):
+        """Wait predicate: the poll's answer choices while it is active, else False."""
+        if self._cached_choices_alive():
+            return self._choice_cache[1]
+        state = driver.execute_script(self._scan_poll_js, self.CHOICE_XPATH, self.NO_POLL_TEXT)
+        if not state["active"]:
+            return False
+        return self._cache_choices(state)
+    
+    def _cache_choices(self, state: dict) -> List[tuple]:
+        """Store the choices from a scan alongside their element references.
+        
+        Inactive or empty scans clear the cache so the next call re-scans.
+        """
+        choices = [
+            (element, choice["id"])
+            for element, choice in zip(state["elements"], state["choices"])
+        ]
+        if state["active"] and state["elements"]:
+            self._choice_cache = (state["elements"], choices)
+        else:
+            self._choice_cache = None
+        return choices
+    
+    def _cached_choices_alive(self) -> bool:
+        """Check in one round-trip that every cached choice is still on the page."""
+        if not self._choice_cache:
+            return False
+        elements, _ = self._choice_cache
+        try:
+            return self.driver.execute_script(
+                self._choices_alive_js, elements, self.NO_POLL_TEXT
+            )
+        except StaleElementReferenceException:
+            return False
+    
+    def _watch_for_poll(self, active: bool) -> Optional[bool]:
+        """Block in-page until the poll becomes active (or inactive).
         
         Returns:
-            List of tuples containing (element, choice_identifier)
+            True once the state is reached, False if the watcher gave up after
+            ~POLL_WATCH_TIMEOUT seconds (callers re-arm it), or None if it
+            failed (e.g. on navigation) and callers should fall back to
+            _poll_until()
         """
+        give_up_after_ms = (POLL_WATCH_TIMEOUT - POLL_WATCH_MARGIN) * 1000
         try:
-            # Look for buttons with the letters A, B, C, D, E
-            choices = []
-            
-            # First try finding elements with specific attributes
-            choice_elements = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                "button[data-choice], .answer-option, button[class*='answer']"
+            return self.driver.execute_async_script(
+                self._watch_poll_js, active, self.CHOICE_XPATH, self.NO_POLL_TEXT, give_up_after_ms
             )
-            
-            if not choice_elements:
-                # If no elements found with the above selectors, look for buttons with text A-E
-                for button in self.driver.find_elements(By.TAG_NAME, "button"):
-                    button_text = button.text.strip()
-                    if button_text in ["A", "B"]:
-                        choices.append((button, button_text))
+        except TimeoutException:
+            # Selenium reports an async script timeout as TimeoutException
+            return False
+        except Exception as e:
+            logger.warning(f"Poll watcher failed, falling back to polling: {e}")
+            return None
+    
+    def answer_poll(self) -> Optional[str]:
+        """Pick and click a random answer in one round-trip.
+        
+        Returns:
+            The clicked choice identifier, or None if no poll is active
+        """
+        try:
+            # Only a label comes back, so this can skip WebDriver's script wrapping
+            result = self._evaluate(
+                self._pick_and_click_js, self.CHOICE_XPATH, self.NO_POLL_TEXT, self._rng.random()
+            )
+        except Exception as e:
+            logger.error(f"Error answering poll: {e}")
+            return None
+        # Runtime.evaluate may come back without a value (e.g. mid-navigation)
+        return (result or {}).get("clicked")
+    
+    def _poll_until(self, check, active: bool):
+        """Re-run a poll check with exponential backoff until it matches.
+        
+        The interval starts at MIN_BACKOFF after each transition and grows by
+        1.5x (plus jitter) up to check_interval while the state stays the same.
+        
+        Args:
+            check: Callable taking the driver; truthy while a poll is active
+            active: Whether to wait for the check to become truthy or falsy
+        
+        Returns:
+            The check's result when waiting for a poll, otherwise True
+        """
+        while True:
+            try:
+                result = check(self.driver)
+            except TRANSIENT_CHECK_ERRORS as e:
+                # Page reloads and frame swaps make scripts fail transiently;
+                # the state is unknown, so neither match nor give up
+                logger.warning(f"Poll check failed, retrying: {e}")
             else:
-                for element in choice_elements:
-                    choice_id = element.get_attribute("data-choice") or element.text.strip()
-                    if choice_id:
-                        choices.append((element, choice_id))
+                if bool(result) == active:
+                    self._backoff = self.MIN_BACKOFF
+                    return result if active else True
             
-            logger.info(f"Found {len(choices)} answer choices")
-            return choices
-        except Exception as e:
-            logger.error(f"Error getting answer choices: {e}")
-            return []
+            time.sleep(self._backoff + self._rng.uniform(0, 0.1))
+            self._backoff = min(self._backoff * 1.5, self.check_interval)
+    
+    def get_answer_choices(self, state: Optional[dict] = None) -> List[tuple]:
+        """Get the available answer choices for the current poll.
+        
+        Args:
+            state: Optional result of a previous scan_poll() to reuse
+        
+        Returns:
+            List of tuples containing (element, choice_identifier)
+        """
+        if state is None and self._cached_choices_alive():
+            return self._choice_cache[1]
+        if state is None:
+            state = self.scan_poll()
+        choices = self._cache_choices(state)
+        logger.info(f"Found {len(choices)} answer choices")
+        return choices
     
     def select_random_answer(self, choices: List[tuple]) -> None:
         """Randomly select one of the available answer choices."""
@@ -217,46 +553,60 @@ class WebclickerAutomator:
             logger.warning("No answer choices available")
             return
             
-        random_choice = random.choice(choices)
+        random_choice = self._rng.choice(choices)
         element, choice_id = random_choice
         
         logger.info(f"Randomly selected answer: {choice_id}")
         
         try:
-            # Click the selected choice
-            element.click()
+            # Dispatch the click in-page, skipping WebDriver's scroll-into-view
+            # and actionability checks; fall back to a native click if that fails
+            try:
+                self.driver.execute_script(self._click_choice_js, element)
+            except StaleElementReferenceException:
+                raise
+            except Exception as e:
+                logger.warning(f"JS click failed, retrying with native click: {e}")
+                element.click()
             logger.info(f"Successfully clicked on answer {choice_id}")
         except Exception as e:
             logger.error(f"Error selecting answer choice: {e}")
     
+    def _wait_for_poll_start(self) -> None:
+        """Block in-page until a poll shows up, re-arming the watcher as needed."""
+        while self._watch_for_poll(active=True) is False:
+            pass
+    
+    def _answer_current_poll(self) -> None:
+        """Answer the poll as soon as it is clickable, one round-trip per try."""
+        choice_id = self._poll_until(lambda driver: self.answer_poll(), active=True)
+        logger.info(f"Active poll detected, answered: {choice_id}")
+        logger.info("Poll answered. Waiting for next poll...")
+    
+    def _wait_for_poll_end(self) -> None:
+        """Block until the answered poll goes away, without re-answering it."""
+        reached = self._watch_for_poll(active=False)
+        while reached is False:
+            reached = self._watch_for_poll(active=False)
+        if reached is None:
+            # Watcher unavailable (e.g. navigation); fall back to polling
+            self._poll_until(self._poll_visible, active=False)
+        self._choice_cache = None
+        logger.info("No active poll. Waiting for next poll...")
+    
     def run(self) -> None:
         """Main loop to continuously check for and answer polls."""
         logger.info(f"Starting WebClicker automation - connecting to {self.url}")
         
         try:
+            # Returns once the DOM is parsed ("eager" page-load strategy)
             self.driver.get(self.url)
             self.login()
             
-            poll_answered = False
-            
             while True:
-                if self.is_poll_active():
-                    if not poll_answered:
-                        logger.info("Active poll detected!")
-                        choices = self.get_answer_choices()
-                        if choices:
-                            self.select_random_answer(choices)
-                            poll_answered = True
-                            logger.info("Poll answered. Waiting for next poll...")
-                        else:
-                            logger.warning("Poll is active but no answer choices found")
-                else:
-                    # Reset the flag when no poll is active
-                    if poll_answered:
-                        logger.info("No active poll. Waiting for next poll...")
-                        poll_answered = False
-                
-                time.sleep(self.check_interval)
+                self._wait_for_poll_start()
+                self._answer_current_poll()
+                self._wait_for_poll_end()
                 
         except KeyboardInterrupt:
             logger.info("Automation stopped by user")
@@ -271,7 +621,7 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description="Automatically answer WebClicker polls")
     parser.add_argument("--url", type=str, required=True, help="WebClicker URL")
-    parser.add_argument("--interval", type=int, default=5, help="Poll check interval in seconds")
+    parser.add_argument("--interval", type=int, default=5, help="Maximum poll check interval in seconds")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode")
     parser.add_argument("--username", type=str, help="Username for login")
     parser.add_argument("--password", type=str, help="Password for login")